@@ -46,6 +46,7 @@ OPTIONS:
                            'unless-stopped', 'on-failure:3'.
     --add-network NET      Network to apply when container uses default/bridge. Examples:
                            'home', 'docker_default'.
+    --parallel N           Concurrent container inspects and script writes (default: 16).
 
 EXAMPLES:
     # Default: generate per-container scripts in recreate_containers.d/
@@ -75,17 +76,34 @@ NOTES:
 
 import argparse
 import os
+import re
 import shlex
 import sys
-from typing import Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import docker
-from docker.errors import DockerException
+from docker.errors import DockerException, NotFound
+
+# Multiline docker run layout: one argument per continuation line
+RUN_PREFIX = "docker run \\\n  "
+ARG_SEPARATOR = " \\\n  "
+
+# Placeholder substituted with the container name in --add-label/--add-env pairs
+NAME_PLACEHOLDER = "{{name}}"
+# (key, value, key_has_placeholder, value_has_placeholder), detected once at parse time
+TemplatePair = Tuple[str, str, bool, bool]
+
+# Maps every ASCII character outside [A-Za-z0-9._-] to "_" for script filenames
+FILENAME_TRANSLATION = str.maketrans(
+    {chr(code): "_" for code in range(128) if not (chr(code).isalnum() or chr(code) in "-_.")}
+)
 
 # Environment variables that are commonly injected by Docker and should be ignored
 SYSTEM_ENV_KEYS = {"PATH", "HOSTNAME", "TERM", "HOME", "PWD"}
 IGNORE_LABEL_PREFIXES = ("org.opencontainers",)
 IGNORE_LABEL_KEYS = {"maintainer", "build_version"}
+IGNORE_LABEL_PREFIX_RE = re.compile("|".join(re.escape(prefix) for prefix in IGNORE_LABEL_PREFIXES))
 DEFAULT_LINUX_CAPS = {
     "AUDIT_WRITE",
     "CHOWN",
@@ -102,6 +120,8 @@ DEFAULT_LINUX_CAPS = {
     "SETUID",
     "SYS_CHROOT",
 }
+# Accept both the bare and the CAP_-prefixed spelling without normalizing per call
+DEFAULT_LINUX_CAPS_NORM = DEFAULT_LINUX_CAPS | {f"CAP_{cap}" for cap in DEFAULT_LINUX_CAPS}
 
 
 def parse_args() -> argparse.Namespace:
@@ -177,47 +197,91 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip existing files without prompting; only create new ones.",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=16,
+        metavar="N",
+        help="Concurrent container inspects and script writes (default: 16).",
+    )
     if len(sys.argv) == 1:
         parser.print_help()
 
     return parser.parse_args()
 
 
-def connect_client() -> docker.DockerClient:
+def connect_client(max_pool_size: int) -> docker.DockerClient:
     try:
-        return docker.from_env()
+        # One keep-alive connection per worker; the default pool (10) would drop and
+        # reopen connections whenever more inspects run concurrently
+        return docker.from_env(max_pool_size=max_pool_size)
     except DockerException as exc:  # pragma: no cover - defensive
         print(f"Error connecting to Docker daemon: {exc}", file=sys.stderr)
         sys.exit(1)
 
 
-def parse_kv_args(raw_items: Iterable[str], kind: str) -> List[Tuple[str, str]]:
-    parsed: List[Tuple[str, str]] = []
+def container_name(attrs: Dict) -> str:
+    # Inspect payloads carry "Name", list summaries carry "Names"
+    name = attrs.get("Name") or next(iter(attrs.get("Names") or []), "")
+    return name.lstrip("/")
+
+
+def short_image_id(image_id: str) -> str:
+    # Same truncation as docker-py's Image.short_id
+    return image_id[:19] if image_id.startswith("sha256:") else image_id[:12]
+
+
+def resolve_image(client: docker.DockerClient, image_id: str) -> str:
+    try:
+        tags = client.api.inspect_image(image_id).get("RepoTags") or []
+    except NotFound:
+        tags = []  # image removed or untagged; the ID still identifies it
+    return tags[0] if tags else short_image_id(image_id)
+
+
+def inspect_container(client: docker.DockerClient, summary: Dict) -> Optional[Dict]:
+    try:
+        attrs = client.api.inspect_container(summary["Id"])
+    except NotFound:
+        return None  # removed while we were iterating
+    cfg = attrs.setdefault("Config", {})
+    if not cfg.get("Image"):
+        # Only inspect the image when the config does not name it
+        cfg["Image"] = resolve_image(client, attrs.get("Image") or summary.get("ImageID", ""))
+    return attrs
+
+
+def render_name_template(template: str, has_placeholder: bool, name: str) -> str:
+    return template.replace(NAME_PLACEHOLDER, name) if has_placeholder else template
+
+
+def parse_kv_args(raw_items: Iterable[str], kind: str) -> List[TemplatePair]:
+    parsed: List[TemplatePair] = []
     for raw in raw_items:
-        if "=" not in raw:
+        key, sep, value = raw.partition("=")
+        if not sep:
             raise ValueError(f"Invalid {kind} '{raw}', expected KEY=VALUE")
-        key, value = raw.split("=", 1)
         key = key.strip()
         if not key:
             raise ValueError(f"Invalid {kind} '{raw}', key is empty")
-        parsed.append((key, value))
+        parsed.append((key, value, NAME_PLACEHOLDER in key, NAME_PLACEHOLDER in value))
     return parsed
 
 
-def parse_label_args(label_args: Iterable[str]) -> List[Tuple[str, str]]:
+def parse_label_args(label_args: Iterable[str]) -> List[TemplatePair]:
     return parse_kv_args(label_args, "label")
 
 
-def parse_env_args(env_args: Iterable[str]) -> List[Tuple[str, str]]:
+def parse_env_args(env_args: Iterable[str]) -> List[TemplatePair]:
     return parse_kv_args(env_args, "environment variable")
 
 
 def filter_env_vars(env_list: Iterable[str]) -> List[str]:
     filtered: List[str] = []
     for item in env_list or []:
-        if "=" not in item:
+        key, sep, _ = item.partition("=")
+        if not sep:
             continue
-        key, _ = item.split("=", 1)
         if key in SYSTEM_ENV_KEYS or key.startswith("DOCKER_"):
             continue
         filtered.append(item)
@@ -225,11 +289,12 @@ def filter_env_vars(env_list: Iterable[str]) -> List[str]:
 
 
 def filter_labels(labels: Dict[str, str]) -> Dict[str, str]:
-    return {
-        key: value
-        for key, value in (labels or {}).items()
-        if key not in IGNORE_LABEL_KEYS and not key.startswith(IGNORE_LABEL_PREFIXES)
-    }
+    filtered: Dict[str, str] = {}
+    for key, value in (labels or {}).items():
+        if key in IGNORE_LABEL_KEYS or IGNORE_LABEL_PREFIX_RE.match(key):
+            continue
+        filtered[key] = value
+    return filtered
 
 
 def format_restart_policy(policy: Dict) -> str:
@@ -243,10 +308,11 @@ def format_restart_policy(policy: Dict) -> str:
     return name
 
 
-def collect_ports(port_settings: Dict[str, List[Dict]]) -> List[str]:
-    port_args: List[str] = []
-    seen: set = set()
-    for container_port, bindings in (port_settings or {}).items():
+def collect_ports(port_settings: Dict[str, List[Dict]]) -> Iterator[Tuple[str, str]]:
+    if not port_settings:
+        return  # e.g. host-network containers
+    seen: Set[str] = set()
+    for container_port, bindings in port_settings.items():
         if not bindings:
             continue  # skip internal-only ports
         for binding in bindings:
@@ -258,18 +324,18 @@ def collect_ports(port_settings: Dict[str, List[Dict]]) -> List[str]:
                 host = f"{host_ip}:{host_port}"
             else:
                 host = host_port
+            # IPv4 and IPv6 bindings of the same port produce identical specs
             spec = f"{host}:{container_port}"
-            arg = f"-p {shlex.quote(spec)}"
-            if arg in seen:
+            if spec in seen:
                 continue
-            seen.add(arg)
-            port_args.append(arg)
-    return port_args
+            seen.add(spec)
+            yield "-p", spec
 
 
-def collect_mounts(mounts: List[Dict]) -> List[str]:
-    mount_args: List[str] = []
-    for mount in mounts or []:
+def collect_mounts(mounts: List[Dict]) -> Iterator[Tuple[str, str]]:
+    if not mounts:
+        return
+    for mount in mounts:
         destination = mount.get("Destination")
         if not destination:
             continue
@@ -279,85 +345,85 @@ def collect_mounts(mounts: List[Dict]) -> List[str]:
             source = mount.get("Source")
             if not source:
                 continue
-            spec_raw = f"{source}:{destination}{ro_suffix}"
-            mount_args.append(f"-v {shlex.quote(spec_raw)}")
+            yield "-v", f"{source}:{destination}{ro_suffix}"
         elif mount_type == "volume":
             name = mount.get("Name") or mount.get("Source")
             if not name:
                 continue
-            spec_raw = f"{name}:{destination}{ro_suffix}"
-            mount_args.append(f"-v {shlex.quote(spec_raw)}")
-    return mount_args
-
+            yield "-v", f"{name}:{destination}{ro_suffix}"
 
-def collect_capabilities(host_cfg: Dict) -> List[str]:
-    def _norm(cap: str) -> str:
-        cap_up = cap.upper()
-        return cap_up[4:] if cap_up.startswith("CAP_") else cap_up
 
-    caps = host_cfg.get("CapAdd") or []
-    args: List[str] = []
+def collect_capabilities(host_cfg: Dict) -> Iterator[Tuple[str, str]]:
+    caps = host_cfg.get("CapAdd")
+    if not caps:
+        return
     for cap in caps:
-        if _norm(cap) in DEFAULT_LINUX_CAPS:
+        if cap.upper() in DEFAULT_LINUX_CAPS_NORM:
             continue
-        args.append(f"--cap-add {shlex.quote(cap)}")
-    return args
+        yield "--cap-add", cap
 
 
-def collect_sysctls(host_cfg: Dict) -> List[str]:
-    sysctls = host_cfg.get("Sysctls") or {}
-    args: List[str] = []
+def collect_sysctls(host_cfg: Dict) -> Iterator[Tuple[str, str]]:
+    sysctls = host_cfg.get("Sysctls")
+    if not sysctls:
+        return
     for key, value in sysctls.items():
-        args.append(f"--sysctl {shlex.quote(f'{key}={value}')}")
-    return args
+        yield "--sysctl", f"{key}={value}"
 
 
-def collect_devices(host_cfg: Dict) -> List[str]:
-    devices = host_cfg.get("Devices") or []
-    args: List[str] = []
+def collect_devices(host_cfg: Dict) -> Iterator[Tuple[str, str]]:
+    devices = host_cfg.get("Devices")
+    if not devices:
+        return
     for device in devices:
         path_on_host = device.get("PathOnHost")
         path_in_container = device.get("PathInContainer")
         if not path_on_host or not path_in_container:
             continue
         cgroup_perms = device.get("CgroupPermissions") or "rwm"
-        spec = f"{path_on_host}:{path_in_container}:{cgroup_perms}"
-        args.append(f"--device {shlex.quote(spec)}")
-    return args
+        yield "--device", f"{path_on_host}:{path_in_container}:{cgroup_perms}"
 
 
-def merge_labels(existing: Dict[str, str], additions: List[Tuple[str, str]], name: str) -> Dict[str, str]:
+def iter_host_args(host_cfg: Dict, net_settings: Dict, mounts: List[Dict]) -> Iterator[Tuple[str, str]]:
+    yield from collect_ports(net_settings.get("Ports"))
+    yield from collect_mounts(mounts)
+    yield from collect_devices(host_cfg)
+    yield from collect_capabilities(host_cfg)
+    yield from collect_sysctls(host_cfg)
+
+
+def merge_labels(existing: Dict[str, str], additions: List[TemplatePair], name: str) -> Dict[str, str]:
     merged = dict(existing or {})
-    for key, raw_value in additions:
-        rendered_key = key.replace("{{name}}", name)
+    for key, value, key_has, value_has in additions:
+        rendered_key = render_name_template(key, key_has, name)
         if rendered_key in merged:
             continue
-        value = raw_value.replace("{{name}}", name)
-        merged[rendered_key] = value
+        merged[rendered_key] = render_name_template(value, value_has, name)
     return merged
 
 
-def merge_envs(existing_envs: List[str], additions: List[Tuple[str, str]], name: str) -> List[str]:
-    env_map: Dict[str, str] = {}
+def merge_envs(existing_envs: List[str], additions: List[TemplatePair], name: str) -> List[str]:
+    merged: List[str] = []
+    existing_keys: set = set()
     for item in existing_envs:
-        if "=" not in item:
+        key, sep, _ = item.partition("=")
+        if not sep:
             continue
-        key, value = item.split("=", 1)
-        env_map.setdefault(key, value)
+        existing_keys.add(key)
+        merged.append(item)
 
-    for key, raw_value in additions:
-        if key in env_map:
+    for key, value, key_has, value_has in additions:
+        rendered_key = render_name_template(key, key_has, name)
+        if rendered_key in existing_keys:
             continue
-        value = raw_value.replace("{{name}}", name)
-        env_map[key] = value
+        existing_keys.add(rendered_key)
+        merged.append(f"{rendered_key}={render_name_template(value, value_has, name)}")
 
-    return [f"{k}={v}" for k, v in env_map.items()]
+    return merged
 
 
 def sanitize_filename(name: str) -> str:
-    trimmed = name.strip("/") or "container"
-    safe = "".join(ch if (ch.isalnum() or ch in {"-", "_", "."}) else "_" for ch in trimmed)
-    return safe
+    return (name.strip("/") or "container").translate(FILENAME_TRANSLATION)
 
 
 def should_overwrite(path: str, overwrite_all: bool) -> Tuple[bool, bool]:
@@ -377,47 +443,42 @@ def should_overwrite(path: str, overwrite_all: bool) -> Tuple[bool, bool]:
 
 
 def format_command(
-    container,
-    add_label_pairs: List[Tuple[str, str]],
-    add_env_pairs: List[Tuple[str, str]],
-    add_restart: str,
+    attrs: Dict,
+    add_label_pairs: List[TemplatePair],
+    add_env_pairs: List[TemplatePair],
+    add_restart: Optional[str],
     add_network: Optional[str],
     include_cmd: bool,
 ) -> str:
-    attrs = container.attrs
-    name = container.name
+    # add_restart/add_network are fallbacks; they only apply when the container has no
+    # restart policy or uses the default/bridge network
+    name = container_name(attrs)
     cfg = attrs.get("Config", {})
     host_cfg = attrs.get("HostConfig", {})
     net_settings = attrs.get("NetworkSettings", {})
 
-    args: List[str] = [f"--name {shlex.quote(name)}"]
+    # (flag, value) pairs; positional arguments (image, cmd) use an empty flag
+    args: List[Tuple[str, str]] = [("--name", name)]
 
     network_mode = host_cfg.get("NetworkMode")
     if network_mode and network_mode not in {"bridge", "default"}:
-        args.append(f"--network {shlex.quote(network_mode)}")
+        args.append(("--network", network_mode))
     elif add_network:
-        args.append(f"--network {shlex.quote(add_network)}")
+        args.append(("--network", add_network))
 
     restart_value = format_restart_policy(host_cfg.get("RestartPolicy", {})) or add_restart
     if restart_value:
-        args.append(f"--restart {shlex.quote(restart_value)}")
+        args.append(("--restart", restart_value))
 
-    args.extend(collect_ports(net_settings.get("Ports")))
-    args.extend(collect_mounts(attrs.get("Mounts")))
-    args.extend(collect_devices(host_cfg))
-    args.extend(collect_capabilities(host_cfg))
-    args.extend(collect_sysctls(host_cfg))
+    args.extend(iter_host_args(host_cfg, net_settings, attrs.get("Mounts")))
 
     env_vars = merge_envs(filter_env_vars(cfg.get("Env", [])), add_env_pairs, name)
-    for env in env_vars:
-        args.append(f"-e {shlex.quote(env)}")
+    args.extend(("-e", env) for env in env_vars)
 
     labels = merge_labels(filter_labels(cfg.get("Labels") or {}), add_label_pairs, name)
-    for key, value in labels.items():
-        args.append(f"--label {shlex.quote(f'{key}={value}')}")
+    args.extend(("--label", f"{key}={value}") for key, value in labels.items())
 
-    image = cfg.get("Image") or (container.image.tags[0] if container.image.tags else container.image.short_id)
-    args.append(shlex.quote(image))
+    args.append(("", cfg.get("Image") or attrs.get("Image", "")))
 
     if include_cmd:
         entrypoint = cfg.get("Entrypoint") or []
@@ -431,27 +492,46 @@ def format_command(
         # If Entrypoint is set, Cmd contains only parameters; otherwise, Cmd's first element is the command
         if entrypoint:
             # Entrypoint is the command, all of Cmd is parameters
-            for part in cmd:
-                args.append(shlex.quote(part))
+            args.extend(("", part) for part in cmd)
         else:
             # Cmd's first element is the command, rest are parameters
-            for part in cmd[1:]:
-                args.append(shlex.quote(part))
+            args.extend(("", part) for part in cmd[1:])
 
-    formatted = " \\\n".join(["docker run"] + [f"  {arg}" for arg in args])
-    return formatted
+    # shlex.quote already returns safe values unchanged; a pre-check would only add a call
+    return RUN_PREFIX + ARG_SEPARATOR.join(
+        f"{flag} {shlex.quote(value)}" if flag else shlex.quote(value) for flag, value in args
+    )
 
 
 def render_container_block(
-    container,
-    add_label_pairs: List[Tuple[str, str]],
-    add_env_pairs: List[Tuple[str, str]],
-    add_restart: str,
+    attrs: Dict,
+    add_label_pairs: List[TemplatePair],
+    add_env_pairs: List[TemplatePair],
+    add_restart: Optional[str],
     add_network: Optional[str],
     include_cmd: bool,
 ) -> str:
-    cmd = format_command(container, add_label_pairs, add_env_pairs, add_restart, add_network, include_cmd)
-    return f"# Container: {container.name}\n{cmd}\n"
+    cmd = format_command(attrs, add_label_pairs, add_env_pairs, add_restart, add_network, include_cmd)
+    return f"# Container: {container_name(attrs)}\n{cmd}\n"
+
+
+def write_script(path: str, chunks: Iterable[str], exclusive: bool = False) -> None:
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if exclusive:
+        flags |= os.O_EXCL  # raises FileExistsError instead of a separate exists() check
+    fd = os.open(path, flags, 0o755)
+    # Chunks go through the file buffer, so the full script never sits in memory as one string
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        # The open() mode is subject to umask and ignored for existing files
+        os.fchmod(fd, 0o755)
+        f.writelines(chunks)
+
+
+def iter_combined_script(blocks: Iterable[str]) -> Iterator[str]:
+    yield "#!/bin/bash\n"
+    for block in blocks:
+        yield "\n"
+        yield block.rstrip() + "\n"
 
 
 def write_output_combined(path: str, blocks: List[str]) -> int:
@@ -460,47 +540,70 @@ def write_output_combined(path: str, blocks: List[str]) -> int:
         print(f"Skipped writing {path}", file=sys.stderr)
         return 0
 
-    script = ["#!/bin/bash", ""]
-    script.extend(blocks)
-    content = "\n".join(script).rstrip() + "\n"
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    os.chmod(path, 0o755)
+    write_script(path, iter_combined_script(blocks))
     return 1
 
 
-def write_output_per_container(directory: str, blocks: List[Tuple[str, str]], no_overwrite: bool = False) -> int:
-    os.makedirs(directory, exist_ok=True)
-    written = 0
+def select_overwrites(directory: str, filenames: List[str]) -> Set[str]:
+    # Ask once for all existing scripts on a terminal; fall back to per-file prompts
+    if len(filenames) > 1 and sys.stdin.isatty():
+        print(f"{len(filenames)} scripts already exist in {directory}:", file=sys.stderr)
+        for filename in filenames:
+            print(f"  {filename}", file=sys.stderr)
+        while True:
+            response = input("Overwrite them? [y/N/s] (s = ask per file) ").strip().lower()
+            if response in {"y", "yes", "a", "all"}:
+                return set(filenames)
+            if response in {"", "n", "no"}:
+                return set()
+            if response in {"s", "select"}:
+                break
+
+    approved: Set[str] = set()
     overwrite_all = False
+    for filename in filenames:
+        should_write, overwrite_all = should_overwrite(os.path.join(directory, filename), overwrite_all)
+        if should_write:
+            approved.add(filename)
+    return approved
 
-    for name, block in blocks:
-        filename = f"{sanitize_filename(name)}.sh"
-        full_path = os.path.join(directory, filename)
-        if no_overwrite and os.path.exists(full_path):
-            continue
-        should_write, overwrite_all = should_overwrite(full_path, overwrite_all)
-        if not should_write:
-            continue
 
-        content = "#!/bin/bash\n\n" + block.rstrip() + "\n"
-        with open(full_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        os.chmod(full_path, 0o755)
-        written += 1
+def write_container_script(path: str, block: str, exclusive: bool) -> bool:
+    try:
+        write_script(path, ("#!/bin/bash\n\n", block.rstrip(), "\n"), exclusive=exclusive)
+    except FileExistsError:
+        return False
+    return True
+
 
-    return written
+def write_output_per_container(
+    directory: str, blocks: List[Tuple[str, str]], no_overwrite: bool = False, workers: int = 1
+) -> int:
+    os.makedirs(directory, exist_ok=True)
+    # One directory read instead of a stat per script
+    with os.scandir(directory) as entries:
+        existing = {entry.name for entry in entries}
+
+    # Keyed by filename so two names sanitizing to the same file never race; last one wins
+    planned = {f"{sanitize_filename(name)}.sh": block for name, block in blocks}
+    conflicts = [filename for filename in planned if filename in existing]
+    approved = select_overwrites(directory, conflicts) if conflicts and not no_overwrite else set()
+
+    # All prompting is done; the remaining work is independent small-file I/O
+    jobs = [
+        (os.path.join(directory, filename), block)
+        for filename, block in planned.items()
+        if filename not in existing or filename in approved
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return sum(executor.map(lambda job: write_container_script(*job, no_overwrite), jobs))
 
 
-def select_containers(containers: List, patterns: List[str]) -> List:
+def select_containers(containers: List[Dict], patterns: List[str]) -> List[Dict]:
     if not patterns:
         return containers
-    lowered = [p.lower() for p in patterns]
-    selected = []
-    for c in containers:
-        if any(pat in c.name.lower() for pat in lowered):
-            selected.append(c)
-    return selected
+    matcher = re.compile("|".join(re.escape(p) for p in patterns), re.IGNORECASE)
+    return [c for c in containers if matcher.search(container_name(c))]
 
 
 def main() -> int:
@@ -512,9 +615,12 @@ def main() -> int:
         print(exc, file=sys.stderr)
         return 2
 
-    client = connect_client()
+    workers = max(1, args.parallel)
+    client = connect_client(workers)
     try:
-        running = client.containers.list()
+        # One /containers/json request returning plain summaries; only the selected
+        # containers get inspected, without building SDK model objects
+        running = client.api.containers()
     except DockerException as exc:
         print(f"Error listing containers: {exc}", file=sys.stderr)
         return 1
@@ -524,19 +630,32 @@ def main() -> int:
         print("No matching running containers found.", file=sys.stderr)
         return 0
 
+    # Inspect round-trips dominate wall time; the GIL is released on socket I/O.
+    # executor.map keeps the original container order.
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            inspected = [
+                attrs
+                for attrs in executor.map(lambda c: inspect_container(client, c), target_containers)
+                if attrs is not None
+            ]
+    except DockerException as exc:
+        print(f"Error inspecting containers: {exc}", file=sys.stderr)
+        return 1
+
     blocks = [
         (
-            c.name,
+            container_name(attrs),
             render_container_block(
-                c,
+                attrs,
                 label_pairs,
                 env_pairs,
-                args.add_restart if not format_restart_policy(c.attrs.get("HostConfig", {}).get("RestartPolicy", {})) else "",
-                args.add_network if (c.attrs.get("HostConfig", {}).get("NetworkMode") in {None, "", "bridge", "default"}) else None,
+                args.add_restart,
+                args.add_network,
                 args.include_cmd,
             ),
         )
-        for c in target_containers
+        for attrs in inspected
     ]
 
     if args.output:
@@ -544,7 +663,7 @@ def main() -> int:
         if written:
             print(f"Wrote {len(blocks)} container definitions to {args.output}")
     else:
-        written = write_output_per_container(args.per_container_dir, blocks, args.no_overwrite)
+        written = write_output_per_container(args.per_container_dir, blocks, args.no_overwrite, workers)
         print(
             f"Wrote {written}/{len(blocks)} container scripts to {args.per_container_dir}"
         )